@@ -22,11 +22,14 @@ plt = Plot(
 # and errorbar commands. Here we set linestyle to 'cycle'
 # to also use automatic cycling
 
-for p in [1, 2, 3, 4, 5, 6, 7, 8, 9, 10]:
+# compute all the powers of x at once, one row per power
+powers = np.arange(1, 11)
+ytrues = np.power(x, powers[:, np.newaxis])
+
+for p, ytrue in zip(powers, ytrues):
     dlab = r'$\mathrm{data%d}$' % p
     clab = r'$y = x^%d$' % p
 
-    ytrue = x**p
     y = ytrue
 
     # the plot() command does not show line by default.  Setting to 'cycle'
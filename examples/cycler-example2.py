@@ -24,13 +24,18 @@ plt = Plot(
     legend=True,
 )
 
-for fac in [1, 2, 3]:
-    label = r'$y = %d \times x$' % fac
-
-    y = x*fac
-
-    # the plot() command does not show line by default.  Setting to 'cycle'
-    # tells it to use the specified cycler
-    plt.plot(x, y, label=label, linestyle='cycle', markeredgecolor='black')
+facs = [1, 2, 3]
+ys = [x*fac for fac in facs]
+labels = [r'$y = %d \times x$' % fac for fac in facs]
+
+# plot all the series in one call.  Like the plot() command, plot_batch does
+# not show line by default.  Setting to 'cycle' tells it to use the
+# specified cycler
+plt.plot_batch(
+    [x]*len(facs), ys,
+    labels=labels,
+    linestyle='cycle',
+    markeredgecolor='black',
+)
 
 plt.show()
@@ -17,11 +17,15 @@ n = 20
 x = np.linspace(-1, 1, n)
 err = 0.3
 
+# compute all the powers of x at once, one row per subplot
+powers = np.arange(1, len(tab.axes) + 1)
+ytrues = np.power(x, powers[:, np.newaxis])
+
 # iterate over subplots
 for i, plt in enumerate(tab):
     pindex = i+1
 
-    ytrue = x**pindex
+    ytrue = ytrues[i]
     y = ytrue + rng.normal(scale=err, size=n)
     yerr = ytrue*0 + err
 
@@ -1,8 +1,6 @@
 # flake8: noqa
+import importlib
 
-from .convenience import plot, plot_hist
-
-from .plot_containers import Plot, Table
 from .legend import Legend
 
 from .colors import (
@@ -31,7 +29,70 @@ from .cyclers import (
 
 from .constants import GOLDEN_ARATIO
 
-from . import axes
-from . import formatters
-
 from .configuration import config
+
+# These pull in matplotlib, so they are only imported when first accessed.
+# Scripts that just use the colors, markers etc. do not pay for the
+# matplotlib import
+_LAZY_ATTRS = {
+    'plot': '.convenience',
+    'plot_hist': '.convenience',
+    'Plot': '.plot_containers',
+    'Table': '.plot_containers',
+}
+_LAZY_MODULES = ('axes', 'formatters', 'convenience', 'plot_containers')
+
+__all__ = [
+    'plot',
+    'plot_hist',
+    'Plot',
+    'Table',
+    'Legend',
+    'get_color',
+    'get_random_colors',
+    'COLORS',
+    'COLOR_VALS',
+    'get_marker',
+    'MARKERS',
+    'MultiCycler',
+    'get_default_multi_cycler',
+    'get_marker_cycler',
+    'get_linestyle_cycler',
+    'get_color_cycler',
+    'DEFAULT_MARKERS',
+    'DEFAULT_LINESTYLES',
+    'DEFAULT_COLORS',
+    'GOLDEN_ARATIO',
+    'config',
+    # submodules
+    'axes',
+    'colors',
+    'configuration',
+    'constants',
+    'convenience',
+    'cyclers',
+    'formatters',
+    'legend',
+    'markers',
+    'plot_containers',
+]
+
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+    elif name in _LAZY_MODULES:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError(
+            "module '%s' has no attribute '%s'" % (__name__, name)
+        )
+
+    # cache so later lookups do not come through here
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,3 +1,4 @@
+import functools
 import numpy as np
 from matplotlib.axes import Axes
 from .formatters import HickoryScalarFormatter, HickoryLogFormatter
@@ -36,6 +37,7 @@ class HickoryAxes(Axes):
             cycler = get_default_multi_cycler()
 
         self.cycler = cycler
+        self._scale_formatters = {}
 
         res = super().__init__(*args, **kw)
 
@@ -51,12 +53,67 @@ class HickoryAxes(Axes):
 
         return super().plot(*args, **kw)
 
-    def errorbar(self, *args, **kw):
+    def plot_batch(self, xs, ys, labels=None, **kw):
+        """
+        plot a set of data series in one call.  The markers and line styles
+        are drawn from the cycler just as for repeated calls to plot
+
+        Parameters
+        ----------
+        xs: sequence of arrays
+            The x values for each series
+        ys: sequence of arrays
+            The y values for each series
+        labels: sequence of str, optional
+            Optional label for each series
+
+        Additional keywords for plot are applied to all series
 
+        Returns
+        -------
+        list with the lines for each series
+        """
+
+        nseries = len(xs)
+        if len(ys) != nseries:
+            raise ValueError(
+                "xs and ys must be same "
+                "length, got %d and %d" % (nseries, len(ys))
+            )
+
+        if labels is None:
+            labels = [None] * nseries
+        elif len(labels) != nseries:
+            raise ValueError(
+                "xs and labels must be same "
+                "length, got %d and %d" % (nseries, len(labels))
+            )
+
+        # the color is the same for all series, resolve it once
         self._set_color(kw)
-        self._set_props_default_noline(kw)
+
+        # same defaults as plot, drawing all the values we need from the
+        # cycles at once
+        markers, linestyles = self._get_props_default_noline(kw, nseries)
+        kw.pop('marker', None)
+        kw.pop('linestyle', None)
+
+        lines = []
+        for x, y, label, marker, linestyle in zip(
+            xs, ys, labels, markers, linestyles,
+        ):
+            series_kw = dict(kw, marker=marker, linestyle=linestyle)
+            if label is not None:
+                series_kw['label'] = label
+
+            lines.append(super().plot(x, y, **series_kw))
+
+        return lines
+
+    def errorbar(self, *args, **kw):
 
         self._set_color(kw)
+        self._set_props_default_noline(kw)
 
         return super().errorbar(*args, **kw)
 
@@ -65,8 +122,6 @@ class HickoryAxes(Axes):
         self._set_color(kw)
         self._set_props_default_line(kw)
 
-        self._set_color(kw)
-
         return super().plot(*args, **kw)
 
     def function(
@@ -76,6 +131,28 @@ class HickoryAxes(Axes):
         npts=100,
         **kw
     ):
+        """
+        plot a function as a curve
+
+        Parameters
+        ----------
+        func: str or callable
+            The function to plot.  If a callable, it is called as func(x).
+            If a string, e.g. 'x**2' or 'np.sin(x)', it is evaluated with x
+            and numpy (as np) available.  The compiled string is cached, so
+            repeated calls with the same string are not re-parsed.
+        range: 2-element sequence, optional
+            The x range over which to evaluate the function.  Defaults
+            to the current x view limits
+        npts: int, optional
+            Number of points at which to evaluate the function, default 100
+
+        Additional keywords for the curve method
+
+        Returns
+        -------
+        list of lines, as returned by the matplotlib plot method
+        """
 
         if range is None:
             range = self._viewLim.intervalx
@@ -85,7 +162,7 @@ class HickoryAxes(Axes):
         if callable(func):
             y = func(x)
         else:
-            y = eval(func)
+            y = eval(_compile_func(func), {'np': np, 'x': x})
 
         return self.curve(x, y, **kw)
 
@@ -94,38 +171,48 @@ class HickoryAxes(Axes):
         defaulting to no line
         """
 
-        has_marker = 'marker' in kw
-        if (not has_marker) or (has_marker and kw['marker'] == 'cycle'):
-            kw['marker'] = self.cycler.next('marker')
-        elif has_marker:
-            if kw['marker'] in MARKERS:
-                kw['marker'] = MARKERS[kw['marker']]
+        markers, linestyles = self._get_props_default_noline(kw, 1)
+        kw['marker'] = markers[0]
+        kw['linestyle'] = linestyles[0]
+
+    def _get_props_default_noline(self, kw, n):
+        """
+        get lists of n markers and linestyles from the keywords, defaulting
+        to no line.  'cycle' values are drawn from the cycler
+        """
+
+        marker = kw.get('marker', 'cycle')
+        if marker == 'cycle':
+            markers = self.cycler.take('marker', n)
+        else:
+            markers = [MARKERS.get(marker, marker)] * n
 
         linestyle = kw.get('linestyle', None)
         if linestyle is None:
-            kw['linestyle'] = 'none'
+            linestyles = ['none'] * n
         elif linestyle == 'cycle':
-            kw['linestyle'] = self.cycler.next('linestyle')
+            linestyles = self.cycler.take('linestyle', n)
+        else:
+            linestyles = [linestyle] * n
+
+        return markers, linestyles
 
     def _set_props_default_line(self, kw):
         """
         defaulting to a line
         """
 
-        has_line = 'linestyle' in kw
-
-        if (not has_line) or (has_line and kw['linestyle'] == 'cycle'):
-            kw['linestyle'] = self.cycler.next('linestyle')
-        elif has_line and kw['linestyle'] is None:
+        linestyle = kw.get('linestyle', 'cycle')
+        if linestyle is None:
             kw['linestyle'] = 'none'
+        elif linestyle == 'cycle':
+            kw['linestyle'] = self.cycler.next('linestyle')
 
-        if 'marker' in kw:
-            if kw['marker'] == 'cycle':
-                kw['marker'] = self.cycler.next('marker')
-            elif kw['marker'] in MARKERS:
-                kw['marker'] = MARKERS[kw['marker']]
+        marker = kw.get('marker', None)
+        if marker == 'cycle':
+            kw['marker'] = self.cycler.next('marker')
         else:
-            kw['marker'] = None
+            kw['marker'] = MARKERS.get(marker, marker)
 
     def hist(
         self,
@@ -168,26 +255,9 @@ class HickoryAxes(Axes):
         Plot instance
         """
 
-        if range is None:
-
-            if len(args) == 0:
-                raise ValueError("send data in position 1")
-
-            x = args[0]
-
-            if min is None:
-                min = x.min()
-            if max is None:
-                max = x.max()
-
-            range = [min, max]
-
-        # binsize takes precedence over bins
-        if binsize is not None:
-
-            bins = int(round((range[1] - range[0]) / binsize))
-            if bins < 1:
-                bins = 1
+        range, bins = _get_hist_range_and_bins(
+            args, binsize=binsize, bins=bins, range=range, min=min, max=max,
+        )
 
         self._set_color(kw)
 
@@ -204,22 +274,70 @@ class HickoryAxes(Axes):
         return super().bar(*args, **kw)
 
     def set_yscale(self, value, **kwargs):
+        if not kwargs and value == self.get_yscale():
+            # the scale is unchanged; rebuilding it would only reset the
+            # tick locators and formatters
+            return
+
         ret = super().set_yscale(value, **kwargs)
-        if value == 'log':
-            self.yaxis.set_major_formatter(HickoryLogFormatter())
-        elif value == 'linear':
-            self.yaxis.set_major_formatter(HickoryScalarFormatter())
+
+        self._set_shared_scale_formatters(
+            self.get_shared_y_axes().get_siblings(self), 'yaxis', value,
+        )
 
         return ret
 
     def set_xscale(self, value, **kwargs):
+        if not kwargs and value == self.get_xscale():
+            # the scale is unchanged; rebuilding it would only reset the
+            # tick locators and formatters
+            return
+
         ret = super().set_xscale(value, **kwargs)
+
+        self._set_shared_scale_formatters(
+            self.get_shared_x_axes().get_siblings(self), 'xaxis', value,
+        )
+
+        return ret
+
+    def _set_shared_scale_formatters(self, siblings, axis_name, value):
+        """
+        set our formatter for the scale on this axis and those of the shared
+        siblings.  Axes shared through sharex/sharey use a single Ticker, so
+        it is set once per Ticker, with ours taking precedence
+        """
+        tickers = set()
+        for ax in [self] + [ax for ax in siblings if ax is not self]:
+            if not isinstance(ax, HickoryAxes):
+                continue
+
+            axis = getattr(ax, axis_name)
+            if id(axis.major) in tickers:
+                continue
+
+            tickers.add(id(axis.major))
+            ax._set_scale_formatter(axis, value)
+
+    def _set_scale_formatter(self, axis, value):
+        """
+        set our formatter for the scale, reusing the instance for the axis
+        if the scale was used before
+        """
         if value == 'log':
-            self.xaxis.set_major_formatter(HickoryLogFormatter())
+            formatter_class = HickoryLogFormatter
         elif value == 'linear':
-            self.xaxis.set_major_formatter(HickoryScalarFormatter())
+            formatter_class = HickoryScalarFormatter
+        else:
+            return
 
-        return ret
+        key = (axis.axis_name, value)
+        formatter = self._scale_formatters.get(key, None)
+        if formatter is None:
+            formatter = formatter_class()
+            self._scale_formatters[key] = formatter
+
+        axis.set_major_formatter(formatter)
 
     def ntext(self, *args, **kw):
         """
@@ -234,8 +352,11 @@ class HickoryAxes(Axes):
 
     def set(self, margin=None, **kw):
         if margin is not None:
-            kw['xmargin'] = margin
-            kw['ymargin'] = margin
+            # set directly rather than adding xmargin/ymargin to the
+            # keywords.  Not via margins(), which also changes the tight
+            # autoscaling setting
+            self.set_xmargin(margin)
+            self.set_ymargin(margin)
 
         # for these, kw are not passed on
         if 'yscale' in kw:
@@ -244,9 +365,54 @@ class HickoryAxes(Axes):
         if 'xscale' in kw:
             self.set_xscale(kw.pop('xscale'))
 
-        super().set(**kw)
+        if kw:
+            return super().set(**kw)
 
     def _set_color(self, kw):
-        if 'color' in kw:
-            if kw['color'] in COLORS:
-                kw['color'] = COLORS[kw['color']]
+        color = kw.get('color', None)
+        if color is not None:
+            kw['color'] = COLORS.get(color, color)
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_func(func):
+    """
+    compile a function string such as 'x**2' once, so repeated calls to
+    HickoryAxes.function with the same string skip the parsing
+    """
+    return compile(func, '<hickory function>', 'eval')
+
+
+def _get_hist_range_and_bins(args, binsize, bins, range, min, max):
+    """
+    get the range and bins to send to the matplotlib hist method
+
+    The data are only scanned for their limits when we need them to compute
+    the bins; otherwise matplotlib/numpy find the range in their own pass
+    rather than us doing the work twice
+    """
+
+    need_range = binsize is not None or min is not None or max is not None
+
+    if range is None and need_range:
+
+        if len(args) == 0:
+            raise ValueError("send data in position 1")
+
+        x = np.asarray(args[0])
+
+        if min is None:
+            min = x.min()
+        if max is None:
+            max = x.max()
+
+        range = [min, max]
+
+    # binsize takes precedence over bins
+    if binsize is not None:
+
+        bins = int(round((range[1] - range[0]) / binsize))
+        if bins < 1:
+            bins = 1
+
+    return range, bins
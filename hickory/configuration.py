@@ -1,7 +1,11 @@
-try:
-    import IPython
-    _name = IPython.get_ipython().__class__.__name__
-except ImportError:
+import sys
+
+# If we are running under IPython it has already been imported, so there is
+# no need to pay for importing it just to find out we are not
+_ipython = sys.modules.get('IPython', None)
+if _ipython is not None:
+    _name = _ipython.get_ipython().__class__.__name__
+else:
     _name = None
 
 config = {
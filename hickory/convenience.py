@@ -92,19 +92,15 @@ def plot(
         show = kw.pop('show', config['show'])
 
     if plt is None:
-        axis_kw = {
-            'xlabel': xlabel,
-            'ylabel': ylabel,
-            'title': title,
-        }
-        if xlim is not None:
-            axis_kw['xlim'] = xlim
-        if ylim is not None:
-            axis_kw['ylim'] = ylim
-        if xlog:
-            axis_kw['xscale'] = 'log'
-        if ylog:
-            axis_kw['yscale'] = 'log'
+        axis_kw = _get_axis_kw(
+            xlabel=xlabel,
+            ylabel=ylabel,
+            title=title,
+            xlim=xlim,
+            ylim=ylim,
+            xlog=xlog,
+            ylog=ylog,
+        )
 
         plt = Plot(
             aratio=aratio,
@@ -144,6 +140,7 @@ def plot_hist(
     max=None,
     xlabel=None,
     ylabel=None,
+    title=None,
     xlim=None,
     ylim=None,
     aratio=None,
@@ -231,9 +228,15 @@ def plot_hist(
         show = kw.pop('show', config['show'])
 
     if plt is None:
-        plt = Plot(
+        axis_kw = _get_axis_kw(
             xlabel=xlabel,
             ylabel=ylabel,
+            title=title,
+            xlim=xlim,
+            ylim=ylim,
+        )
+
+        plt = Plot(
             aratio=aratio,
             legend=legend,
             figsize=figsize,
@@ -245,6 +248,7 @@ def plot_hist(
             subplotpars=subplotpars,
             tight_layout=tight_layout,
             constrained_layout=constrained_layout,  # default to rc
+            **axis_kw
         )
 
     plt.hist(
@@ -263,3 +267,33 @@ def plot_hist(
         plt.show()
 
     return plt
+
+
+def _get_axis_kw(
+    xlabel=None,
+    ylabel=None,
+    title=None,
+    xlim=None,
+    ylim=None,
+    xlog=False,
+    ylog=False,
+):
+    """
+    get the axis keywords for the Plot constructor, only including
+    the limits and scales if they were set
+    """
+    axis_kw = {
+        'xlabel': xlabel,
+        'ylabel': ylabel,
+        'title': title,
+    }
+    if xlim is not None:
+        axis_kw['xlim'] = xlim
+    if ylim is not None:
+        axis_kw['ylim'] = ylim
+    if xlog:
+        axis_kw['xscale'] = 'log'
+    if ylog:
+        axis_kw['yscale'] = 'log'
+
+    return axis_kw
@@ -26,13 +26,13 @@ DEFAULT_LINESTYLES = (
     EXTRA_LINESTYLES['very loose dashed'],
     EXTRA_LINESTYLES['dense dashed'],
 )
-DEFAULT_COLORS = [
+DEFAULT_COLORS = (
     '#1f77b4', '#ff7f0e', '#2ca02c', '#d62728',
     '#9467bd', '#8c564b', '#e377c2', '#7f7f7f', '#bcbd22', '#17becf',
-]
+)
 
 # qualitative, color blind safe
-QUAL1 = [
+QUAL1 = (
     '#a50026',
     '#d73027',
     '#f46d43',
@@ -46,10 +46,12 @@ QUAL1 = [
     '#74add1',
     '#4575b4',
     '#313695',
-]
+)
 
 
 class MultiCycler(object):
+    __slots__ = ('_cycles',)
+
     def __init__(self, **kw):
         self._cycles = {}
 
@@ -60,10 +62,30 @@ class MultiCycler(object):
                 self._cycles[key] = itertools.cycle(cyc)
 
     def next(self, type):
-        if type not in self._cycles:
-            raise ValueError("unknown cycle: '%s'" % type)
-
-        return next(self._cycles[type])
+        return next(self._get_cycle(type))
+
+    def take(self, type, n):
+        """
+        get the next n values from the specified cycle in one call
+
+        Parameters
+        ----------
+        type: str
+            The cycle to draw from, e.g. 'marker'
+        n: int
+            Number of values to get
+
+        Returns
+        -------
+        list of values
+        """
+        return list(itertools.islice(self._get_cycle(type), n))
+
+    def _get_cycle(self, type):
+        try:
+            return self._cycles[type]
+        except KeyError:
+            raise ValueError("unknown cycle: '%s'" % type) from None
 
 
 def get_default_multi_cycler():
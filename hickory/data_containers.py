@@ -10,7 +10,37 @@ import numpy as np
 from .colors import get_color
 
 
+def _get_color(self):
+    return self._color
+
+
+def _set_color(self, color):
+    # resolve the name once here rather than every time the container is
+    # drawn
+    self._color = color
+    self._resolved_color = None if color is None else get_color(color)
+
+
 class Points(object):
+    __slots__ = (
+        'x', 'y', 'xerr', 'yerr',
+        'label',
+        'marker',
+        'fillstyle',
+        'size',
+        'linestyle',
+        'linewidth',
+        '_color',
+        '_resolved_color',
+        'edgecolor',
+        'edgewidth',
+        'alpha',
+        'ecolor',
+        'capsize',
+    )
+
+    color = property(_get_color, _set_color)
+
     def __init__(
         self,
         x, y, xerr=None, yerr=None,
@@ -49,28 +79,29 @@ class Points(object):
         self.xerr = _make_array_maybe(xerr)
         self.yerr = _make_array_maybe(yerr)
 
-        if self.x.size != self.y.size:
+        n = self.x.size
+        if self.y.size != n:
             raise ValueError(
                 "x and y must be same "
-                "size, got %d and %d" % (self.x.size, self.y.size)
+                "size, got %d and %d" % (n, self.y.size)
             )
 
-        if self.xerr is not None and self.x.size != self.xerr.size:
+        if self.xerr is not None and self.xerr.size != n:
             raise ValueError(
                 "x and xerr must be same "
-                "size, got %d and %d" % (self.x.size, self.xerr.size)
+                "size, got %d and %d" % (n, self.xerr.size)
             )
-        if self.yerr is not None and self.y.size != self.yerr.size:
+        if self.yerr is not None and self.yerr.size != n:
             raise ValueError(
                 "y and yerr must be same "
-                "size, got %d and %d" % (self.y.size, self.yerr.size)
+                "size, got %d and %d" % (n, self.yerr.size)
             )
 
     def _add_to_axes(self, ax):
 
-        color = None if self.color is None else get_color(self.color)
+        color = self._resolved_color
         fillstyle = 'none' if self.fillstyle is None else self.fillstyle
-        ecolor = self.ecolor if self.ecolor is not None else self.color
+        ecolor = self.ecolor if self.ecolor is not None else color
 
         linestyle = 'none' if self.linestyle is None else self.linestyle
         ax.errorbar(
@@ -97,6 +128,8 @@ class Curve(Points):
     Same as Points but defaults to marker None and now support for
     error bars
     """
+    __slots__ = ()
+
     def __init__(
         self, x, y,
         label=None,
@@ -126,6 +159,14 @@ class Curve(Points):
 
 
 class HLine(object):
+    __slots__ = (
+        'y', 'xmin', 'xmax',
+        'label', 'linestyle', 'linewidth', '_color', '_resolved_color',
+        'alpha',
+    )
+
+    color = property(_get_color, _set_color)
+
     def __init__(self,
                  y=0,
                  xmin=0, xmax=1,
@@ -143,7 +184,7 @@ class HLine(object):
         self.alpha = alpha
 
     def _add_to_axes(self, ax):
-        color = None if self.color is None else get_color(self.color)
+        color = self._resolved_color
         linestyle = 'none' if self.linestyle is None else self.linestyle
         ax.axhline(
             y=self.y,
@@ -158,6 +199,14 @@ class HLine(object):
 
 
 class VLine(object):
+    __slots__ = (
+        'x', 'ymin', 'ymax',
+        'label', 'linestyle', 'linewidth', '_color', '_resolved_color',
+        'alpha',
+    )
+
+    color = property(_get_color, _set_color)
+
     def __init__(self,
                  x=0,
                  ymin=0, ymax=1,
@@ -175,7 +224,7 @@ class VLine(object):
         self.alpha = alpha
 
     def _add_to_axes(self, ax):
-        color = None if self.color is None else get_color(self.color)
+        color = self._resolved_color
         linestyle = 'none' if self.linestyle is None else self.linestyle
         ax.axvline(
             x=self.x,
@@ -193,4 +242,5 @@ def _make_array_maybe(data):
     if data is None:
         return None
     else:
-        return np.array(data, ndmin=1, copy=False)
+        # returns array input as is, without a copy
+        return np.atleast_1d(data)
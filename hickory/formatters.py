@@ -1,3 +1,5 @@
+import functools
+import re
 import matplotlib
 
 
@@ -25,12 +27,20 @@ class HickoryLogFormatter(matplotlib.ticker.LogFormatterSciNotation):
         s = super().__call__(x, pos=pos)
 
         if 'mathdefault' in s:
-            s = self.format = _remove_mathdefault(s)
+            s = _remove_mathdefault(s)
 
         return s
 
 
+# greedy, so the closing brace matched is the outer one, e.g. for
+# \mathdefault{10^{2}}
+_MATHDEFAULT_RE = re.compile(r'\\mathdefault\{(.*)\}')
+
+
+@functools.lru_cache(maxsize=512)
 def _remove_mathdefault(s):
-    s = s.replace(r'\mathdefault{', '')
-    s = s[0:-2] + '$'
-    return s
+    """
+    remove the \\mathdefault{} wrapper from a label or format string.  The
+    same few tick strings recur on every draw, so the results are cached
+    """
+    return _MATHDEFAULT_RE.sub(r'\1', s)
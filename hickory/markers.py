@@ -13,14 +13,8 @@ def get_marker(marker_name):
     marker chracter value
     """
 
-    m = MARKERS.get(marker_name, None)
-    if m is None:
-        return marker_name
-    else:
-        return m
-        # raise ValueError("no marker '%s' found" % marker_name)
-
-    return m
+    # names not in the table are assumed to be marker values already
+    return MARKERS.get(marker_name, marker_name)
 
 
 # name access to some of the markers
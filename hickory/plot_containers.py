@@ -1,10 +1,11 @@
 import numpy as np
-import matplotlib.pyplot as mplt
+from matplotlib.figure import Figure
 from matplotlib.axes import (
     SubplotBase,
     subplot_class_factory,
 )
 from numbers import Integral
+from types import MethodType
 
 from .legend import Legend
 from .constants import GOLDEN_ARATIO
@@ -23,8 +24,8 @@ class _PlotContainer(object):
     """
     def show(self, dpi=None, fork=False):
         """
-        Show the plot on the display.  Requires tkinter and pillow/PIL to be
-        installed and able to connect to a display
+        Show the plot on the display.  Requires tkinter to be installed and
+        able to connect to a display
 
         Parameters
         ----------
@@ -42,10 +43,14 @@ class _PlotContainer(object):
             # store it permanently)
             self.set_dpi(dpi)
 
-        if self._legend:
-            self.legend(*self._legend.args, **self._legend.kw)
+        if self.stale:
+            # if nothing changed since the last draw, the legend and aspect
+            # are already in place, and re-applying them would force a
+            # re-render
+            if self._legend:
+                self.legend(*self._legend.args, **self._legend.kw)
 
-        self._set_aratio_maybe()
+            self._set_aratio_maybe()
 
         _show_fig(self, fork=fork)
 
@@ -63,19 +68,56 @@ class _PlotContainer(object):
         ----------
         file: str
             Filename to write
+        bbox_inches: str or Bbox, optional
+            Default 'tight', which trims the whitespace around the plot.
+            This requires an extra draw to measure the bounding box, so send
+            None to skip it when writing many files
         **kw see savefig docs for additional keywords
         """
 
-        if self._legend:
-            self.legend(*self._legend.args, **self._legend.kw)
+        if self.stale:
+            # see show()
+            if self._legend:
+                self.legend(*self._legend.args, **self._legend.kw)
 
-        self._set_aratio_maybe()
+            self._set_aratio_maybe()
 
         super().savefig(file, bbox_inches=bbox_inches, **kwargs)
 
+    @property
+    def stale(self):
+        return self._stale
+
+    @stale.setter
+    def stale(self, val):
+        # any change to the figure invalidates the image cached by _show_fig
+        if val:
+            self._show_image = None
+
+        Figure.stale.fset(self, val)
+
+    def __getstate__(self):
+        state = super().__getstate__()
+
+        # the image cached by _show_fig can be re-rendered, don't pickle it
+        state.pop('_show_image', None)
+        return state
+
+    @property
+    def aratio(self):
+        return self._aratio
+
+    @aratio.setter
+    def aratio(self, aratio):
+        # the aspect is only applied when showing or saving, so flag the
+        # figure as changed
+        self._aratio = aratio
+        self.stale = True
+
     def _set_aratio_maybe(self):
-        if hasattr(self, 'aratio') and self.aratio is not None:
-            self.set_aratio(self.aratio)
+        aratio = getattr(self, 'aratio', None)
+        if aratio is not None:
+            self.set_aratio(aratio)
             # self.set_aspect(
             #     1.0/self.get_data_ratio()*self.aratio
             # )
@@ -104,7 +146,7 @@ class _PlotContainer(object):
             # trigger errors later (via SubplotSpec._from_subplot_args).
             if (len(args) == 1 and isinstance(args[0], Integral)
                     and 100 <= args[0] <= 999):
-                args = tuple(map(int, str(args[0])))
+                args = (args[0] // 100, args[0] // 10 % 10, args[0] % 10)
             projection_class, pkw = self._process_projection_requirements(
                 *args, **kwargs)
 
@@ -121,18 +163,10 @@ class _PlotContainer(object):
         return self._add_axes_internal(ax, key)
 
     def __iter__(self):
-        self._ax_index = 0
-        return self
+        return iter(self.axes)
 
-    def __next__(self):
-        if self._ax_index == len(self.axes):
-            raise StopIteration
-        plt = self.axes[self._ax_index]
-        self._ax_index += 1
-        return plt
 
-
-class Plot(_PlotContainer, mplt.Figure):
+class Plot(_PlotContainer, Figure):
     """
     A plot container.  This class provides an interface to both
     the Figure and axis functionality in one.
@@ -201,7 +235,8 @@ class Plot(_PlotContainer, mplt.Figure):
         ax.xaxis.set_major_formatter(HickoryScalarFormatter())
         ax.yaxis.set_major_formatter(HickoryScalarFormatter())
 
-        self.set(**axis_kw)
+        if axis_kw:
+            self.set(**axis_kw)
 
         self.aratio = aratio
         self._set_legend(legend)
@@ -225,17 +260,54 @@ class Plot(_PlotContainer, mplt.Figure):
         else:
             self._legend = None
 
+        # the legend is only drawn when showing or saving
+        self.stale = True
+
     def legend(self, *args, **kw):
         self.axes[0].legend(*args, **kw)
 
+    def delaxes(self, ax):
+        """
+        remove the axes, also dropping any of its methods cached by
+        __getattr__.  clf() and ax.remove() both come through here
+        """
+        super().delaxes(ax)
+
+        cached = [
+            name for name, value in self.__dict__.items()
+            if isinstance(value, MethodType) and value.__self__ is ax
+        ]
+        for name in cached:
+            del self.__dict__[name]
+
     def __getattr__(self, name):
         """
         pass on calls to the axis, e.g. making a plot
+
+        Bound methods of the axis are cached on the instance, so later
+        lookups do not come through here.  Other attributes, such as
+        xaxis or lines, are looked up every time since the axis may
+        rebind them
         """
-        return getattr(self.axes[0], name)
+        if name[:2] == '__':
+            # special names are looked up by protocols such as pickle and
+            # copy; they belong to the Figure, not the axis
+            raise AttributeError(
+                "'%s' object has no attribute '%s'" % (
+                    type(self).__name__, name,
+                )
+            )
+
+        ax = self.axes[0]
+        value = getattr(ax, name)
+
+        if isinstance(value, MethodType) and value.__self__ is ax:
+            self.__dict__[name] = value
 
+        return value
 
-class Table(_PlotContainer, mplt.Figure):
+
+class Table(_PlotContainer, Figure):
     """
     A plot container for a table of subplots.  Provides
     access to the Figure and subplot grid in one interface.
@@ -306,30 +378,26 @@ class Table(_PlotContainer, mplt.Figure):
 
 
 def _show_fig(fig, fork=False):
-    import io
-
-    io_buf = io.BytesIO()
-
-    # cannot set bbox_inches tight here because in fig.canvas.print_figure it
-    # does not store the bbox permanently, it resets it to what it was before
-    # the call
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
 
-    fig.savefig(io_buf, bbox_inches=None, format='raw')
-    io_buf.seek(0)
+    # render with Agg and view its pixel buffer directly, rather than going
+    # through savefig and copying the raw bytes via a BytesIO.  As in
+    # savefig, the canvas is swapped in only for the render
 
-    shape = (
-        int(fig.bbox.bounds[3]),
-        int(fig.bbox.bounds[2]),
-        -1,
-    )
+    # the image is kept until the figure is next marked stale, so showing an
+    # unchanged figure again does not re-render it
+    img_array = getattr(fig, '_show_image', None)
 
-    data = np.frombuffer(io_buf.getvalue(), dtype=np.uint8)
-    img_array = np.reshape(
-        data,
-        newshape=shape,
-    )
+    if img_array is None:
+        orig_canvas = fig.canvas
+        canvas = FigureCanvasAgg(fig)
+        try:
+            canvas.draw()
+            img_array = np.asarray(canvas.buffer_rgba())
+        finally:
+            fig.set_canvas(orig_canvas)
 
-    io_buf.close()
+        fig._show_image = img_array
 
     if fork:
         from multiprocessing import Process
@@ -341,15 +409,13 @@ def _show_fig(fig, fork=False):
 
 class _TkinterWindowFromArray(object):
     """
-    requires pillow/PIL
+    display an RGB or RGBA image array in a Tk window
     """
     def __init__(self, img_array):
-        from tkinter import Tk, Canvas, NW, TclError
-        from PIL import ImageTk, Image
+        from tkinter import Tk, Canvas, PhotoImage, NW, TclError
 
         try:
-            img = Image.fromarray(img_array)
-            w, h = img.size
+            h, w = img_array.shape[:2]
 
             self.root = Tk()
             self.root.bind('q', self.destroy)
@@ -357,7 +423,9 @@ class _TkinterWindowFromArray(object):
             canvas = Canvas(self.root, width=w, height=h)
             canvas.pack()
 
-            self.imgtk = ImageTk.PhotoImage(img)
+            self.imgtk = PhotoImage(
+                data=_array_to_ppm(img_array), format='PPM',
+            )
             canvas.create_image(0, 0, anchor=NW, image=self.imgtk)
             self.root.mainloop()
         except TclError:
@@ -369,3 +437,15 @@ class _TkinterWindowFromArray(object):
 
 def _show_array_tkinter(img_array):
     _ = _TkinterWindowFromArray(img_array)
+
+
+def _array_to_ppm(img_array):
+    """
+    encode the image array as base64 PPM data, which Tk reads natively, so
+    we don't need PIL to convert it
+    """
+    import base64
+
+    h, w = img_array.shape[:2]
+    header = b'P6\n%d %d\n255\n' % (w, h)
+    return base64.b64encode(header + img_array[:, :, :3].tobytes())